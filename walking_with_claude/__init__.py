@@ -1,3 +1,22 @@
 """Walking with Claude — Claude controls your walking pad."""
 
+import os
+
 __version__ = "0.1.0"
+
+
+def _socket_path() -> str:
+    """Per-user path of the daemon's hook socket (shared by daemon and hook).
+
+    $XDG_RUNTIME_DIR is private to the user. Otherwise use the temp dir with
+    the uid in the name — read from $TMPDIR directly, since the hook runs on
+    every tool call and importing tempfile costs ~20ms.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "walking-with-claude.sock")
+    tmp = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(tmp, f"walking-with-claude-{os.getuid()}.sock")
+
+
+SOCKET_PATH = _socket_path()
@@ -3,8 +3,9 @@ Walking daemon — background process that holds the BLE connection
 and responds to heartbeats from Claude Code hooks.
 
 Heartbeat model:
-  - Hooks fire curl requests on PreToolUse, SessionStart, etc.
-  - Each request resets a timer.
+  - Hooks send a datagram to SOCKET_PATH (or POST over HTTP) on
+    PreToolUse, SessionStart, etc.
+  - Each heartbeat resets a timer.
   - No heartbeat for SLOW_AFTER seconds → slow to minimum speed.
   - No heartbeat for STOP_AFTER seconds → stop the belt.
 
@@ -17,19 +18,21 @@ Run:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
+import socket
+import sys
 import time
+from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
 import uvicorn
-from starlette.applications import Starlette
-from starlette.requests import Request
-from starlette.responses import JSONResponse
-from starlette.routing import Route
 
 from sperax_rm01 import SperaxPad
 
+from walking_with_claude import SOCKET_PATH
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
 log = logging.getLogger("walking-daemon")
 
@@ -41,209 +44,440 @@ SLOW_AFTER = 30.0      # seconds without heartbeat → slow down
 STOP_AFTER = 60.0      # seconds without heartbeat → stop
 MIN_SPEED = 1.0        # km/h when slowing down
 DEFAULT_SPEED = 2.0    # km/h on start
+DEBOUNCE = 1.0         # seconds to suppress repeat heartbeat speed writes
+COALESCE = 0.5         # seconds after queuing BLE work to absorb repeat heartbeats
+STATUS_TTL = 0.25      # seconds /status serves a cached body
 
 # ---------------------------------------------------------------------------
 # State
 # ---------------------------------------------------------------------------
-pad = SperaxPad()
-last_heartbeat: float = 0.0
-target_speed: float = DEFAULT_SPEED
-sessions: set[str] = set()        # track active session IDs
-_watchdog_task: asyncio.Task | None = None
+@dataclass(slots=True)
+class DaemonState:
+    """Everything the daemon mutates. One instance, handed to every handler."""
+
+    pad: SperaxPad = field(default_factory=SperaxPad)
+    last_heartbeat: float = 0.0       # time.monotonic(); 0.0 = none yet
+    target_speed: float = DEFAULT_SPEED
+    sessions: set[str] = field(default_factory=set)  # active session IDs
+
+    # Last speed a heartbeat wrote to the pad, so repeats can skip the BLE
+    # write. Any other path that changes the belt speed resets it to None.
+    last_written_speed: float | None = None
+    last_write_ts: float = 0.0
+
+    # Heartbeats before this time (monotonic) that ask for nothing new are
+    # absorbed rather than queuing more BLE work.
+    bucket_until: float = 0.0
+
+    # The one pending/in-flight heartbeat BLE task, and whether a speed
+    # change arrived that it hasn't applied yet
+    apply_task: asyncio.Task | None = None
+    speed_pending: bool = False
+
+    # (monotonic time built, serialized body) for /status
+    status_cache: tuple[float, bytes] = (0.0, b"")
+    # (state key, serialized body) for the queued-heartbeat reply
+    heartbeat_cache: tuple[tuple, bytes] = ((), b"")
+
+    # Watchdog timers, re-armed on every heartbeat
+    slow_handle: asyncio.TimerHandle | None = None
+    stop_handle: asyncio.TimerHandle | None = None
 
+    # Datagram endpoint bound to SOCKET_PATH, if we own it
+    hook_transport: asyncio.DatagramTransport | None = None
 
-def _state() -> dict[str, Any]:
+
+_FAST_OK = orjson.dumps({"ok": True, "fast": True})  # fast-path heartbeat reply
+_COALESCED = orjson.dumps({"ok": True, "coalesced": True})
+
+_background: set[asyncio.Task] = set()  # strong refs to in-flight BLE work
+_connect_lock = asyncio.Lock()    # one BLE scan+connect at a time
+
+
+def _state(d: DaemonState) -> dict[str, Any]:
+    pad = d.pad
     return {
         "connected": pad.connected,
         "running": pad.running,
         "speed": pad.speed,
-        "target_speed": target_speed,
-        "sessions": len(sessions),
-        "last_heartbeat_ago": round(time.time() - last_heartbeat, 1) if last_heartbeat else None,
+        "target_speed": d.target_speed,
+        "sessions": len(d.sessions),
+        "last_heartbeat_ago": round(time.monotonic() - d.last_heartbeat, 1) if d.last_heartbeat else None,
     }
 
 
+def _parse_body(raw: bytes) -> dict[str, Any]:
+    """Parse a JSON object body. Empty or malformed bodies read as {}."""
+    if not raw:
+        return {}
+    try:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Run a coroutine in the background, holding a reference until done."""
+    task = asyncio.create_task(coro)
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+    return task
+
+
+async def _ensure_connected(pad: SperaxPad):
+    """Connect to the pad if needed. Concurrent callers share one attempt."""
+    if pad.connected:
+        return
+    async with _connect_lock:
+        if not pad.connected:
+            await pad.connect()
+            log.info("BLE connected")
+
+
+def _heartbeat_fresh(d: DaemonState) -> bool:
+    """True if a live session has sent a heartbeat within SLOW_AFTER."""
+    return (
+        d.last_heartbeat != 0.0
+        and bool(d.sessions)
+        and time.monotonic() - d.last_heartbeat <= SLOW_AFTER
+    )
+
+
+async def _apply_heartbeat(d: DaemonState):
+    """Connect, start, or re-speed the pad for heartbeats. Runs detached.
+
+    Only one of these exists at a time (d.apply_task); heartbeats that land
+    meanwhile just update d.target_speed / d.speed_pending and this picks
+    them up before exiting. A connect can take many seconds, so the
+    heartbeat is re-checked afterwards — the belt is never started for a
+    session that has since ended or gone quiet.
+    """
+    pad = d.pad
+    try:
+        await _ensure_connected(pad)
+
+        while True:
+            speed_requested, d.speed_pending = d.speed_pending, False
+            if not _heartbeat_fresh(d):
+                log.info("Heartbeat went stale — leaving the pad alone")
+                return
+
+            # Snapshot: target_speed may change while we await the pad
+            speed, now = d.target_speed, time.monotonic()
+            if not pad.running:
+                await pad.start(speed=speed)
+                d.last_written_speed, d.last_write_ts = speed, now
+                _arm_watchdog(d)
+                log.info("Started at %s km/h", speed)
+            elif speed_requested and (
+                speed != d.last_written_speed or now - d.last_write_ts > DEBOUNCE
+            ):
+                await pad.set_speed(speed)
+                d.last_written_speed, d.last_write_ts = speed, now
+
+            if not d.speed_pending:
+                return
+    except Exception as e:
+        d.last_written_speed = None
+        log.warning("Heartbeat BLE error: %s", e)
+    finally:
+        d.apply_task = None
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
 
-async def handle_heartbeat(request: Request) -> JSONResponse:
-    """Heartbeat from a Claude Code hook. Keeps the pad running."""
-    global last_heartbeat, target_speed
+async def handle_heartbeat(d: DaemonState, body: dict[str, Any]) -> tuple[int, bytes]:
+    """Heartbeat from a Claude Code hook. Keeps the pad running.
 
-    body = {}
-    try:
-        body = await request.json()
-    except Exception:
-        pass
+    BLE work is queued in the background; the response only confirms
+    receipt, so the hook isn't held up by GATT round-trips.
+    """
+    pad = d.pad
 
     session_id = body.get("session", "default")
     speed = body.get("speed", None)
 
-    last_heartbeat = time.time()
-    sessions.add(session_id)
+    now = d.last_heartbeat = time.monotonic()
+    _arm_watchdog(d)
+    d.sessions.add(session_id)
+
+    # Fast path: the usual mid-session heartbeat, nothing for the pad to do
+    if speed is None and pad.connected and pad.running:
+        return 200, _FAST_OK
 
     if speed is not None:
-        target_speed = max(0.5, min(6.0, float(speed)))
+        speed = max(0.5, min(6.0, float(speed)))
 
-    # Auto-connect and start if not running
-    if not pad.connected:
-        try:
-            await pad.connect()
-            log.info("BLE connected")
-        except Exception as e:
-            return JSONResponse({"ok": False, "error": str(e)}, status_code=503)
+    # BLE work went out moments ago and this asks for nothing new — absorb it
+    if now < d.bucket_until and speed in (None, d.target_speed):
+        return 200, _COALESCED
+    d.bucket_until = now + COALESCE
 
-    if not pad.running:
-        await pad.start(speed=target_speed)
-        log.info(f"Started at {target_speed} km/h")
-    elif speed is not None:
-        await pad.set_speed(target_speed)
+    if speed is not None:
+        d.target_speed = speed
+        d.speed_pending = True
 
-    return JSONResponse({"ok": True, **_state()})
+    # Auto-connect and start if not running — at most one task at a time
+    if d.apply_task is None:
+        d.apply_task = _spawn(_apply_heartbeat(d))
 
+    # last_heartbeat_ago is always 0.0 here, so the reply only varies with
+    # the pad and session fields — reuse the last body while they hold.
+    key = (pad.connected, pad.running, pad.speed, d.target_speed, len(d.sessions))
+    cached_key, payload = d.heartbeat_cache
+    if key != cached_key:
+        payload = orjson.dumps({"ok": True, "queued": True, **_state(d)})
+        d.heartbeat_cache = (key, payload)
+    return 200, payload
 
-async def handle_start(request: Request) -> JSONResponse:
-    """Explicitly start the pad."""
-    global last_heartbeat, target_speed
 
-    body = {}
-    try:
-        body = await request.json()
-    except Exception:
-        pass
+async def handle_start(d: DaemonState, body: dict[str, Any]) -> tuple[int, bytes]:
+    """Explicitly start the pad."""
+    pad = d.pad
 
     speed = body.get("speed", DEFAULT_SPEED)
-    target_speed = max(0.5, min(6.0, float(speed)))
-    last_heartbeat = time.time()
+    d.target_speed = max(0.5, min(6.0, float(speed)))
+    d.last_heartbeat = time.monotonic()
+    _arm_watchdog(d)
 
-    if not pad.connected:
-        try:
-            await pad.connect()
-            log.info("BLE connected")
-        except Exception as e:
-            return JSONResponse({"ok": False, "error": str(e)}, status_code=503)
+    try:
+        await _ensure_connected(pad)
+    except Exception as e:
+        return 503, orjson.dumps({"ok": False, "error": str(e)})
 
-    await pad.start(speed=target_speed)
-    log.info(f"Started at {target_speed} km/h")
-    return JSONResponse({"ok": True, **_state()})
+    await pad.start(speed=d.target_speed)
+    d.last_written_speed = None
+    _arm_watchdog(d)
+    log.info("Started at %s km/h", d.target_speed)
+    return 200, orjson.dumps({"ok": True, **_state(d)})
 
 
-async def handle_stop(request: Request) -> JSONResponse:
+async def handle_stop(d: DaemonState, body: dict[str, Any]) -> tuple[int, bytes]:
     """Stop the pad."""
-    global last_heartbeat
-
-    body = {}
-    try:
-        body = await request.json()
-    except Exception:
-        pass
+    pad = d.pad
 
     session_id = body.get("session", None)
-    if session_id and session_id in sessions:
-        sessions.discard(session_id)
+    if session_id and session_id in d.sessions:
+        d.sessions.discard(session_id)
 
     # Only stop if no active sessions left, or explicit stop
-    if session_id is None or len(sessions) == 0:
+    if session_id is None or len(d.sessions) == 0:
         if pad.connected and pad.running:
             await pad.stop()
             log.info("Stopped")
-        last_heartbeat = 0.0
-        sessions.clear()
+        d.last_heartbeat = 0.0
+        d.sessions.clear()
+        _disarm_watchdog(d)
 
-    return JSONResponse({"ok": True, **_state()})
+    return 200, orjson.dumps({"ok": True, **_state(d)})
 
 
-async def handle_speed(request: Request) -> JSONResponse:
+async def handle_speed(d: DaemonState, body: dict[str, Any]) -> tuple[int, bytes]:
     """Change speed."""
-    global target_speed, last_heartbeat
-
-    body = {}
-    try:
-        body = await request.json()
-    except Exception:
-        pass
+    pad = d.pad
 
     speed = body.get("speed", DEFAULT_SPEED)
-    target_speed = max(0.5, min(6.0, float(speed)))
-    last_heartbeat = time.time()
+    d.target_speed = max(0.5, min(6.0, float(speed)))
+    d.last_heartbeat = time.monotonic()
+    _arm_watchdog(d)
 
     if pad.connected and pad.running:
-        await pad.set_speed(target_speed)
-        log.info(f"Speed → {target_speed} km/h")
+        await pad.set_speed(d.target_speed)
+        d.last_written_speed = None
+        log.info("Speed → %s km/h", d.target_speed)
 
-    return JSONResponse({"ok": True, **_state()})
+    return 200, orjson.dumps({"ok": True, **_state(d)})
 
 
-async def handle_status(request: Request) -> JSONResponse:
-    """Return current state."""
-    return JSONResponse(_state())
+async def handle_status(d: DaemonState, body: dict[str, Any]) -> tuple[int, bytes]:
+    """Return current state. Cached for STATUS_TTL so polling stays cheap."""
+    now = time.monotonic()
+    built, payload = d.status_cache
+    if now - built >= STATUS_TTL:
+        payload = orjson.dumps(_state(d))
+        d.status_cache = (now, payload)
+    return 200, payload
 
 
-async def handle_session_end(request: Request) -> JSONResponse:
+async def handle_session_end(d: DaemonState, body: dict[str, Any]) -> tuple[int, bytes]:
     """A Claude session ended. Remove it and maybe stop."""
-    body = {}
-    try:
-        body = await request.json()
-    except Exception:
-        pass
+    pad = d.pad
 
     session_id = body.get("session", "default")
-    sessions.discard(session_id)
-    log.info(f"Session ended: {session_id} ({len(sessions)} remaining)")
+    d.sessions.discard(session_id)
+    log.info("Session ended: %s (%s remaining)", session_id, len(d.sessions))
 
-    if len(sessions) == 0 and pad.connected and pad.running:
+    if len(d.sessions) == 0 and pad.connected and pad.running:
         await pad.stop()
+        _disarm_watchdog(d)
         log.info("All sessions ended — stopped")
 
-    return JSONResponse({"ok": True, **_state()})
+    return 200, orjson.dumps({"ok": True, **_state(d)})
 
 
 # ---------------------------------------------------------------------------
-# Watchdog — auto slow/stop on heartbeat timeout
+# Watchdog — auto slow/stop on heartbeat timeout, re-armed per heartbeat
 # ---------------------------------------------------------------------------
 
-async def watchdog():
-    """Background task: slow down and stop if heartbeats stop coming."""
-    global last_heartbeat
-    slowed = False
+def _arm_watchdog(d: DaemonState):
+    """(Re)start the slow/stop timers, counting from d.last_heartbeat.
 
-    while True:
-        await asyncio.sleep(5)
+    Called whenever a heartbeat lands, and again whenever the daemon itself
+    starts the belt — a start can come long after the heartbeat that asked
+    for it (slow BLE connect), when the original timers have already fired.
+    """
+    _disarm_watchdog(d)
+    loop = asyncio.get_running_loop()
+    elapsed = time.monotonic() - d.last_heartbeat if d.last_heartbeat else STOP_AFTER
+    if elapsed < STOP_AFTER:
+        d.slow_handle = loop.call_later(max(0.0, SLOW_AFTER - elapsed), _fire_slow, d)
+    d.stop_handle = loop.call_later(max(0.0, STOP_AFTER - elapsed), _fire_stop, d)
 
-        if last_heartbeat == 0.0 or not pad.running:
-            slowed = False
-            continue
 
-        elapsed = time.time() - last_heartbeat
+def _fire_slow(d: DaemonState):
+    d.slow_handle = None
+    _spawn(_do_slow(d))
 
-        if elapsed > STOP_AFTER:
-            if pad.connected and pad.running:
-                await pad.stop()
-                log.info(f"No heartbeat for {STOP_AFTER}s — stopped")
-                sessions.clear()
-            slowed = False
 
-        elif elapsed > SLOW_AFTER and not slowed:
-            if pad.connected and pad.running:
-                await pad.set_speed(MIN_SPEED)
-                log.info(f"No heartbeat for {SLOW_AFTER}s — slowed to {MIN_SPEED} km/h")
-            slowed = True
+def _fire_stop(d: DaemonState):
+    d.stop_handle = None
+    _spawn(_do_stop(d))
+
+
+def _disarm_watchdog(d: DaemonState):
+    """Cancel any pending slow/stop timers."""
+    for handle in (d.slow_handle, d.stop_handle):
+        if handle is not None:
+            handle.cancel()
+    d.slow_handle = d.stop_handle = None
+
+
+async def _do_slow(d: DaemonState):
+    """No heartbeat for SLOW_AFTER seconds — drop to MIN_SPEED."""
+    pad = d.pad
+    if pad.connected and pad.running:
+        try:
+            await pad.set_speed(MIN_SPEED)
+        except Exception as e:
+            log.warning("Error slowing pad: %s", e)
+            return
+        d.last_written_speed = None
+        log.info("No heartbeat for %ss — slowed to %s km/h", SLOW_AFTER, MIN_SPEED)
+
+
+async def _do_stop(d: DaemonState):
+    """No heartbeat for STOP_AFTER seconds — stop the belt."""
+    pad = d.pad
+    if pad.connected and pad.running:
+        try:
+            await pad.stop()
+        except Exception as e:
+            log.warning("Error stopping pad: %s", e)
+            return
+        log.info("No heartbeat for %ss — stopped", STOP_AFTER)
+        d.sessions.clear()
+
+
+# ---------------------------------------------------------------------------
+# Hook socket — one datagram per hook event, no HTTP, no reply
+# ---------------------------------------------------------------------------
+
+class _HookProtocol(asyncio.DatagramProtocol):
+    """Turn b"heartbeat|<session>" datagrams into handler calls."""
+
+    def datagram_received(self, data: bytes, addr: Any):
+        route, _, session = data.partition(b"|")
+        handler = _DGRAM_ROUTES.get(route)
+        if handler is None:
+            return
+        session_id = session.decode(errors="replace") or "default"
+        _spawn(_run_hook(handler, session_id))
+
+
+async def _run_hook(handler, session_id: str):
+    """Run a handler for a datagram. There's no response to carry errors."""
+    try:
+        await handler(state, {"session": session_id})
+    except Exception as e:
+        log.warning("Hook %s failed: %s", handler.__name__, e)
+
+
+async def _open_hook_socket(d: DaemonState):
+    """Bind SOCKET_PATH, clearing a stale file left by a dead daemon."""
+    try:
+        owner = os.lstat(SOCKET_PATH).st_uid
+    except FileNotFoundError:
+        owner = None
+    if owner is not None and owner != os.getuid():
+        log.warning("%s belongs to another user — hooks will fall back to HTTP", SOCKET_PATH)
+        return
+    if owner is not None:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            probe.connect(SOCKET_PATH)
+        except ConnectionRefusedError:
+            os.unlink(SOCKET_PATH)  # nobody listening
+        else:
+            log.warning("%s is in use — hooks will fall back to HTTP", SOCKET_PATH)
+            return
+        finally:
+            probe.close()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(SOCKET_PATH)
+    os.chmod(SOCKET_PATH, 0o600)
+    sock.setblocking(False)
+    loop = asyncio.get_running_loop()
+    d.hook_transport, _ = await loop.create_datagram_endpoint(_HookProtocol, sock=sock)
+
+
+def _close_hook_socket(d: DaemonState):
+    if d.hook_transport is None:
+        return
+    d.hook_transport.close()
+    d.hook_transport = None
+    try:
+        os.unlink(SOCKET_PATH)
+    except FileNotFoundError:
+        pass
 
 
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
 
+async def _warm_connect():
+    """Connect at startup so the first heartbeat doesn't wait on a BLE scan."""
+    try:
+        await _ensure_connected(state.pad)
+    except Exception as e:
+        log.warning("BLE warm connect failed: %s", e)
+
+
+async def _startup():
+    """Open the hook socket and start connecting to the pad."""
+    try:
+        await _open_hook_socket(state)
+    except OSError as e:
+        log.warning("Could not open %s: %s — hooks will fall back to HTTP", SOCKET_PATH, e)
+    _spawn(_warm_connect())
+
+
 async def _shutdown():
     """Stop the pad and disconnect on server shutdown."""
     log.info("Shutting down — stopping walking pad...")
+    pad = state.pad
+    _close_hook_socket(state)
+    _disarm_watchdog(state)
     if pad.connected and pad.running:
         try:
             await pad.stop()
             log.info("Pad stopped")
         except Exception as e:
-            log.warning(f"Error stopping pad: {e}")
+            log.warning("Error stopping pad: %s", e)
     if pad.connected:
         try:
             await pad.disconnect()
@@ -252,25 +486,80 @@ async def _shutdown():
             pass
 
 
-app = Starlette(
-    routes=[
-        Route("/heartbeat", handle_heartbeat, methods=["POST", "GET"]),
-        Route("/start", handle_start, methods=["POST"]),
-        Route("/stop", handle_stop, methods=["POST"]),
-        Route("/speed", handle_speed, methods=["POST"]),
-        Route("/status", handle_status, methods=["GET"]),
-        Route("/session/end", handle_session_end, methods=["POST"]),
-    ],
-    on_startup=[lambda: asyncio.create_task(watchdog())],
-    on_shutdown=[_shutdown],
-)
+state = DaemonState()
 
+# path → (handler, allowed methods). Six loopback routes don't need a router.
+# GET routes answer HEAD too, as Starlette did; uvicorn drops the body.
+_ROUTES = {
+    "/heartbeat": (handle_heartbeat, ("POST", "GET", "HEAD")),
+    "/start": (handle_start, ("POST",)),
+    "/stop": (handle_stop, ("POST",)),
+    "/speed": (handle_speed, ("POST",)),
+    "/status": (handle_status, ("GET", "HEAD")),
+    "/session/end": (handle_session_end, ("POST",)),
+}
 
-def main():
-    """Run the walking daemon."""
-    import signal
+# Datagram route → handler. Hooks only ever heartbeat or end a session.
+_DGRAM_ROUTES = {
+    b"heartbeat": handle_heartbeat,
+    b"session/end": handle_session_end,
+}
+
+_JSON = [(b"content-type", b"application/json")]
+_TEXT = [(b"content-type", b"text/plain; charset=utf-8")]
+
+
+async def _respond(send, status: int, headers: list, payload: bytes):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": headers + [(b"content-length", b"%d" % len(payload))],
+    })
+    await send({"type": "http.response.body", "body": payload})
 
-    print(f"""
+
+async def _lifespan(receive, send):
+    """ASGI lifespan: warm-connect on startup, stop the pad on shutdown."""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await _startup()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await _shutdown()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """Bare ASGI app: dispatch on path, hand the JSON body to the handler."""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    route = _ROUTES.get(scope["path"])
+    if route is None:
+        await _respond(send, 404, _TEXT, b"Not Found")
+        return
+    handler, methods = route
+    if scope["method"] not in methods:
+        await _respond(send, 405, _TEXT, b"Method Not Allowed")
+        return
+
+    raw = b""
+    while True:
+        message = await receive()
+        raw += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+
+    status, payload = await handler(state, _parse_body(raw))
+    await _respond(send, status, _JSON, payload)
+
+
+_BANNER = f"""
     ╔══════════════════════════════════════╗
     ║     Walking with Claude — Daemon     ║
     ║                                      ║
@@ -280,8 +569,26 @@ def main():
     ║  Slow after {SLOW_AFTER}s, stop after {STOP_AFTER}s    ║
     ║  Ctrl-C to stop (pad stops too)      ║
     ╚══════════════════════════════════════╝
-    """)
-    uvicorn.run(app, host="127.0.0.1", port=PORT, log_level="warning")
+"""
+
+
+def main():
+    """Run the walking daemon."""
+    import signal
+
+    if sys.stderr.isatty():
+        sys.stderr.write(_BANNER)
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=PORT,
+        log_level="warning",
+        loop="uvloop",
+        http="httptools",
+        interface="asgi3",
+        backlog=512,              # headroom for bursts of parallel tool hooks
+        timeout_keep_alive=30,
+    )
 
 
 if __name__ == "__main__":
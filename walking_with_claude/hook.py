@@ -3,7 +3,8 @@
 Hook handler — called by Claude Code hooks.
 
 Reads hook event JSON from stdin, sends appropriate request to the daemon.
-Designed to be fast (fire and forget) so it doesn't slow down Claude.
+Designed to be fast (fire and forget) so it doesn't slow down Claude:
+one datagram to the daemon's Unix socket, with HTTP as the fallback.
 
 Usage in hooks config:
     python -m walking_with_claude.hook
@@ -11,57 +12,101 @@ Usage in hooks config:
 
 from __future__ import annotations
 
-import json
+import os
+import socket
 import sys
-import urllib.request
-import urllib.error
 
-DAEMON_URL = "http://127.0.0.1:7463"
+import orjson
+
+from walking_with_claude import SOCKET_PATH
+
+DAEMON_ADDR = ("127.0.0.1", 7463)
+
+# (datagram prefix, HTTP request head), built once. Over HTTP only
+# Content-Length and the body vary.
+_HEARTBEAT = (
+    b"heartbeat|",
+    b"POST /heartbeat HTTP/1.0\r\nContent-Type: application/json\r\n",
+)
+_SESSION_END = (
+    b"session/end|",
+    b"POST /session/end HTTP/1.0\r\nContent-Type: application/json\r\n",
+)
 
 
 def main():
-    # Read hook event from stdin
+    # Read hook event from stdin — raw bytes, no text decoding
     try:
-        data = json.load(sys.stdin)
+        raw = sys.stdin.buffer.read()
+        data = orjson.loads(raw) if raw else {}
     except Exception:
         data = {}
+    if not isinstance(data, dict):
+        data = {}
 
     event = data.get("hook_event_name", "")
     session_id = data.get("session_id", "default")
 
-    payload = json.dumps({"session": session_id}).encode()
-
     if event == "SessionStart":
-        _post("/heartbeat", payload)
+        _send(_HEARTBEAT, session_id)
 
     elif event in ("PreToolUse", "PostToolUse"):
-        _post("/heartbeat", payload)
+        _send(_HEARTBEAT, session_id)
 
     elif event == "Stop":
         # Claude finished responding — still a heartbeat, user might reply
-        _post("/heartbeat", payload)
+        _send(_HEARTBEAT, session_id)
 
     elif event == "Notification":
         ntype = data.get("notification_type", "")
         if ntype == "idle_prompt":
             # Claude is idle — this is the wind-down signal
-            _post("/session/end", payload)
+            _send(_SESSION_END, session_id)
 
     elif event == "SessionEnd":
-        _post("/session/end", payload)
+        _send(_SESSION_END, session_id)
 
 
-def _post(path: str, payload: bytes):
-    """Fire-and-forget POST to daemon. Fail silently."""
+def _send(route: tuple[bytes, bytes], session_id: str):
+    """Fire-and-forget: datagram to the daemon socket, else HTTP POST."""
+    prefix, head = route
     try:
-        req = urllib.request.Request(
-            DAEMON_URL + path,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        urllib.request.urlopen(req, timeout=2)
-    except Exception:
+        # Only our own daemon's socket — never hand session IDs to another user
+        if os.stat(SOCKET_PATH).st_uid != os.getuid():
+            raise PermissionError(SOCKET_PATH)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            sock.sendto(prefix + str(session_id).encode(), SOCKET_PATH)
+        return
+    except OSError:
+        pass  # no socket (or daemon busy) — try HTTP
+    _post(head, _payload(session_id))
+
+
+def _payload(session_id: str) -> bytes:
+    """Encode the daemon request body. Session IDs are UUIDs, so skip orjson."""
+    if (
+        isinstance(session_id, str)
+        and session_id.isprintable()
+        and '"' not in session_id
+        and "\\" not in session_id
+    ):
+        return b'{"session":"' + session_id.encode() + b'"}'
+    return orjson.dumps({"session": session_id})
+
+
+def _post(head: bytes, payload: bytes):
+    """Fire-and-forget POST to daemon. Fail silently.
+
+    Plain HTTP/1.0 over a raw socket — no urllib, no response parsing.
+    We still wait for the first byte of the reply: hanging up before the
+    daemon has read the body makes uvicorn drop the request.
+    """
+    try:
+        with socket.create_connection(DAEMON_ADDR, timeout=0.5) as sock:
+            sock.sendall(head + b"Content-Length: %d\r\n\r\n" % len(payload) + payload)
+            sock.recv(1)
+    except OSError:
         pass  # Daemon not running — that's fine
 
 
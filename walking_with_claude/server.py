@@ -44,6 +44,10 @@ _lock = asyncio.Lock()
 async def _get_pad() -> SperaxPad:
     """Get or create and connect the shared SperaxPad instance."""
     global _pad
+    # Fast path: already connected, no need to queue behind the lock
+    pad = _pad
+    if pad is not None and pad.connected:
+        return pad
     async with _lock:
         if _pad is None:
             _pad = SperaxPad()
@@ -144,6 +148,12 @@ async def walking_status() -> str:
 
 def main():
     """Run the MCP server (stdio transport)."""
+    try:
+        import uvloop
+    except ImportError:
+        pass  # stdlib loop is fine, just slower
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run(transport="stdio")
 
 